@@ -32,6 +32,7 @@ from zipline.pipeline.loaders.blaze.core import (
     NonNumpyField,
     NonPipelineField,
     no_deltas_rules,
+    overwrite_novel_deltas,
 )
 from zipline.utils.numpy_utils import (
     float64_dtype,
@@ -1083,6 +1084,43 @@ class BlazeToPipelineTestCase(TestCase):
                 compute_fn=op.itemgetter(-1),
             )
 
+    def test_novel_deltas_sort_after_baseline_ties(self):
+        # Use enough rows sharing each timestamp that an unstable sort would
+        # reorder the ties.
+        dates = pd.date_range('2014-01-01', '2014-01-05')
+        per_date = 20
+        repeated_dates = dates.repeat(per_date)
+        baseline = pd.DataFrame({
+            'sid': np.tile(np.arange(per_date), len(dates)),
+            'value': np.arange(len(repeated_dates), dtype=float),
+            'asof_date': repeated_dates,
+            'timestamp': repeated_dates,
+        })
+        # Every delta is known on its asof_date, so all of them are novel.
+        deltas = baseline.copy()
+        deltas['value'] += 1000
+
+        sparse_output, non_novel_deltas = overwrite_novel_deltas(
+            baseline,
+            deltas,
+            dates,
+        )
+
+        self.assertTrue(non_novel_deltas.empty)
+        # Within each timestamp the baseline rows keep their order and the
+        # deltas follow them, so the deltas win ``last`` in the date group.
+        expected = pd.concat(
+            list(chain.from_iterable(
+                (
+                    baseline[baseline.timestamp == dt],
+                    deltas[deltas.timestamp == dt],
+                )
+                for dt in dates
+            )),
+            ignore_index=True,
+        )
+        assert_frame_equal(sparse_output.reset_index(drop=True), expected)
+
     def test_novel_deltas_macro(self):
         asset_info = asset_infos[0][0]
         base_dates = pd.DatetimeIndex([
@@ -0,0 +1,105 @@
+"""
+Tests for the helpers in zipline.pipeline.loaders.utils.
+"""
+from datetime import time
+from unittest import TestCase
+
+import pandas as pd
+from pandas.util.testing import assert_frame_equal, assert_series_equal
+
+from zipline.pipeline.loaders.utils import normalize_timestamp_to_query_time
+
+
+class NormalizeTimestampToQueryTimeTestCase(TestCase):
+
+    def _normalize(self, timestamps, inplace=False):
+        df = pd.DataFrame({
+            'timestamp': pd.to_datetime(timestamps),
+            'value': range(len(timestamps)),
+        })
+        return df, normalize_timestamp_to_query_time(
+            df,
+            time(8, 45),
+            'US/Eastern',
+            inplace=inplace,
+            ts_field='timestamp',
+        )
+
+    def assert_normalized(self, result, expected):
+        assert_series_equal(
+            result['timestamp'],
+            pd.Series(pd.to_datetime(expected), name='timestamp'),
+        )
+
+    def test_cutoff_boundary(self):
+        _, result = self._normalize([
+            # 8:45 EST, exactly at the query time
+            '2014-01-02 13:45',
+            # 8:44:59.999999 EST, just before the query time
+            '2014-01-02 13:44:59.999999',
+            # 20:00 EST, the UTC date is already the next day
+            '2014-01-03 01:00',
+        ])
+        self.assert_normalized(
+            result,
+            ['2014-01-03', '2014-01-02', '2014-01-03'],
+        )
+
+    def test_dst_transition(self):
+        _, result = self._normalize([
+            # 7:45 EST, the day before clocks move forward
+            '2014-03-08 12:45',
+            # 8:45 EDT, the day clocks move forward
+            '2014-03-09 12:45',
+            # 8:44 EDT
+            '2014-03-09 12:44',
+            # 8:45 EDT, the day before clocks move back
+            '2014-11-01 12:45',
+            # 7:45 EST, the day clocks move back
+            '2014-11-02 12:45',
+        ])
+        self.assert_normalized(
+            result,
+            [
+                '2014-03-08',
+                '2014-03-10',
+                '2014-03-09',
+                '2014-11-02',
+                '2014-11-02',
+            ],
+        )
+
+    def test_copy(self):
+        df, result = self._normalize(['2014-01-02 13:45'], inplace=False)
+        self.assertIsNot(result, df)
+        assert_frame_equal(
+            df,
+            pd.DataFrame({
+                'timestamp': pd.to_datetime(['2014-01-02 13:45']),
+                'value': [0],
+            }),
+        )
+        self.assert_normalized(result, ['2014-01-03'])
+
+    def test_inplace(self):
+        df, result = self._normalize(['2014-01-02 13:45'], inplace=True)
+        self.assertIs(result, df)
+        self.assert_normalized(df, ['2014-01-03'])
+
+    def test_empty(self):
+        for inplace in (True, False):
+            df = pd.DataFrame({'timestamp': [], 'value': []}, dtype=object)
+            result = normalize_timestamp_to_query_time(
+                df,
+                time(8, 45),
+                'US/Eastern',
+                inplace=inplace,
+                ts_field='timestamp',
+            )
+            self.assertTrue(result.empty)
+            self.assertEqual(result['timestamp'].dtype, 'datetime64[ns]')
+            if inplace:
+                self.assertIs(result, df)
+            else:
+                self.assertIsNot(result, df)
+                self.assertEqual(df['timestamp'].dtype, object)
@@ -395,6 +395,35 @@ class USEquityPricingLoaderTestCase(TestCase):
                 self.assertEqual(adj.last_col, expected.last_col)
                 assert_allclose(adj.value, expected.value)
 
+    def _dividend_ratio_writer(self):
+        return SQLiteAdjustmentWriter(
+            ':memory:',
+            self.calendar_days,
+            MockDailyBarSpotReader(),
+        )
+
+    def test_calc_dividend_ratios(self):
+        ratios = self._dividend_ratio_writer().calc_dividend_ratios(DIVIDENDS)
+
+        assert_array_equal(ratios.sid, DIVIDENDS_EXPECTED.sid)
+        assert_array_equal(
+            ratios.effective_date,
+            DIVIDENDS_EXPECTED.effective_date,
+        )
+        assert_allclose(ratios.ratio, DIVIDENDS_EXPECTED.ratio)
+
+    def test_calc_dividend_ratios_ex_date_not_in_calendar(self):
+        writer = self._dividend_ratio_writer()
+        for ex_date in (
+                # A Saturday inside the calendar.
+                Timestamp('2015-06-13', tz='UTC'),
+                # After the last session of the calendar.
+                Timestamp('2015-07-01', tz='UTC')):
+            dividends = DIVIDENDS.copy()
+            dividends.loc[2, 'ex_date'] = ex_date.to_datetime64()
+            with self.assertRaises(KeyError):
+                writer.calc_dividend_ratios(dividends)
+
     def test_read_no_adjustments(self):
         adjustment_reader = NullAdjustmentReader()
         columns = [USEquityPricing.close, USEquityPricing.volume]
@@ -12,12 +12,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from cpython cimport (
-    PyDict_Contains,
-    PySet_Add,
-)
+from cpython cimport PySet_Add
+
+from collections import defaultdict
 
 from numpy import (
+    array,
+    int64,
     uint32,
     zeros,
 )
@@ -29,9 +30,10 @@ ctypedef object DatetimeIndex_t
 ctypedef object Int64Index_t
 
 from zipline.lib.adjustment import Float64Multiply
-from zipline.assets.asset_writer import (
-    SQLITE_MAX_VARIABLE_NUMBER as SQLITE_MAX_IN_STATEMENT,
-)
+from zipline.assets.asset_writer import SQLITE_MAX_VARIABLE_NUMBER
+
+# Leave room for the two date bound parameters in each adjustment query.
+SQLITE_MAX_IN_STATEMENT = SQLITE_MAX_VARIABLE_NUMBER - 2
 
 _SID_QUERY_TEMPLATE = """
 SELECT DISTINCT sid FROM {0}
@@ -42,10 +44,12 @@ cdef dict SID_QUERIES = {
     for tablename in ('splits', 'dividends', 'mergers')
 }
 
+# The date bounds are bound as parameters so that the statement text only
+# depends on the number of sids, letting sqlite reuse prepared statements.
 ADJ_QUERY_TEMPLATE = """
 SELECT sid, ratio, effective_date
 FROM {0}
-WHERE sid IN ({1}) AND effective_date >= {2} AND effective_date <= {3}
+WHERE sid IN ({1}) AND effective_date >= ? AND effective_date <= ?
 """
 
 EPOCH = Timestamp(0, tz='UTC')
@@ -94,6 +98,46 @@ cdef set _get_dividend_sids(object db, int start_date, int end_date):
     return _get_sids_from_table(db, 'dividends', start_date, end_date)
 
 
+cdef list _get_adjustments_from_table(object cursor,
+                                     str tablename,
+                                     set table_sids,
+                                     int start_date,
+                                     int end_date,
+                                     Int64Index_t assets):
+    """
+    Get the (sid, ratio, effective_date) rows between start_date and end_date
+    from table `tablename` for the members of `assets` in `table_sids`.
+
+    Parameters
+    ----------
+    cursor : sqlite3.Cursor
+    tablename : str
+    table_sids : set
+        The sids known to have adjustments in `tablename` in the date range.
+    start_date : int (seconds since epoch)
+    end_date : int (seconds since epoch)
+    assets : pd.Int64Index
+
+    Returns
+    -------
+    results : list[tuple]
+    """
+    cdef list to_query = [str(a) for a in assets if a in table_sids]
+    cdef list results = []
+    cdef list query_assets
+    while to_query:
+        query_len = min(len(to_query), SQLITE_MAX_IN_STATEMENT)
+        query_assets = to_query[:query_len]
+        statement = ADJ_QUERY_TEMPLATE.format(
+            tablename,
+            ",".join(['?' for _ in query_assets]),
+        )
+        cursor.execute(statement, query_assets + [start_date, end_date])
+        to_query = to_query[query_len:]
+        results.extend(cursor.fetchall())
+    return results
+
+
 cdef _adjustments(object adjustments_db,
                   set split_sids,
                   set merger_sids,
@@ -103,44 +147,17 @@ cdef _adjustments(object adjustments_db,
                   Int64Index_t assets):
 
     c = adjustments_db.cursor()
-
-    splits_to_query = [str(a) for a in assets if a in split_sids]
-    splits_results = []
-    while splits_to_query:
-        query_len = min(len(splits_to_query), SQLITE_MAX_IN_STATEMENT)
-        query_assets = splits_to_query[:query_len]
-        t= [str(a) for a in query_assets]
-        statement = ADJ_QUERY_TEMPLATE.format('splits',
-            ",".join(['?' for _ in query_assets]), start_date, end_date)
-        c.execute(statement, t)
-        splits_to_query = splits_to_query[query_len:]
-        splits_results.extend(c.fetchall())
-
-    mergers_to_query = [str(a) for a in assets if a in merger_sids]
-    mergers_results = []
-    while mergers_to_query:
-        query_len = min(len(mergers_to_query), SQLITE_MAX_IN_STATEMENT)
-        query_assets = mergers_to_query[:query_len]
-        t= [str(a) for a in query_assets]
-        statement = ADJ_QUERY_TEMPLATE.format('mergers',
-            ",".join(['?' for _ in query_assets]), start_date, end_date)
-        c.execute(statement, t)
-        mergers_to_query = mergers_to_query[query_len:]
-        mergers_results.extend(c.fetchall())
-
-    dividends_to_query = [str(a) for a in assets if a in dividends_sids]
-    dividends_results = []
-    while dividends_to_query:
-        query_len = min(len(dividends_to_query), SQLITE_MAX_IN_STATEMENT)
-        query_assets = dividends_to_query[:query_len]
-        t= [str(a) for a in query_assets]
-        statement = ADJ_QUERY_TEMPLATE.format('dividends',
-            ",".join(['?' for _ in query_assets]), start_date, end_date)
-        c.execute(statement, t)
-        dividends_to_query = dividends_to_query[query_len:]
-        dividends_results.extend(c.fetchall())
-
-    return splits_results, mergers_results, dividends_results
+    return (
+        _get_adjustments_from_table(
+            c, 'splits', split_sids, start_date, end_date, assets,
+        ),
+        _get_adjustments_from_table(
+            c, 'mergers', merger_sids, start_date, end_date, assets,
+        ),
+        _get_adjustments_from_table(
+            c, 'dividends', dividends_sids, start_date, end_date, assets,
+        ),
+    )
 
 
 cpdef load_adjustments_from_sqlite(object adjustments_db,  # sqlite3.Connection
@@ -194,101 +211,87 @@ cpdef load_adjustments_from_sqlite(object adjustments_db,  # sqlite3.Connection
         assets,
     )
 
-    cdef list results = [{} for column in columns]
-    cdef dict asset_ixs = {}  # Cache sid lookups here.
-    cdef dict date_ixs = {}
+    cdef list results = [defaultdict(list) for column in columns]
     cdef:
         int i
-        int dt
         int sid
         double ratio
         int eff_date
         int date_loc
         Py_ssize_t asset_ix
-        dict col_adjustments
+        object col_adjustments
 
     cdef ndarray[int64_t, ndim=1] _dates_seconds = \
-        dates.values.astype('datetime64[s]').view(int)
-
-    # Pre-populate date index cache.
-    for i, dt in enumerate(_dates_seconds):
-        date_ixs[dt] = i
-
-    # splits affect prices and volumes, volumes is the inverse
-    for sid, ratio, eff_date in splits:
-        if eff_date < start_date:
-            continue
-
-        date_loc = _lookup_dt(date_ixs, eff_date, _dates_seconds)
-
-        if not PyDict_Contains(asset_ixs, sid):
-            asset_ixs[sid] = assets.get_loc(sid)
-        asset_ix = asset_ixs[sid]
-
+        dates.values.astype('datetime64[s]').view(int64)
+
+    # Process every adjustment in a single pass. The splits come first so
+    # that adjustments on the same date keep their splits, mergers, dividends
+    # order.
+    cdef list rows = splits + mergers + dividends
+    cdef Py_ssize_t nsplits = len(splits)
+    cdef Py_ssize_t row_ix
+
+    for row_ix, ((sid, ratio, eff_date), date_loc, asset_ix) in enumerate(zip(
+            rows,
+            _date_locs(_dates_seconds, rows),
+            _asset_locs(assets, rows))):
         price_adj = Float64Multiply(0, date_loc, asset_ix, asset_ix, ratio)
         for i, column in enumerate(columns):
             col_adjustments = results[i]
             if column != 'volume':
-                try:
-                    col_adjustments[date_loc].append(price_adj)
-                except KeyError:
-                    col_adjustments[date_loc] = [price_adj]
-            else:
+                col_adjustments[date_loc].append(price_adj)
+            elif row_ix < nsplits:
+                # splits affect prices and volumes, volumes is the inverse;
+                # mergers and dividends affect prices only
                 volume_adj = Float64Multiply(
                     0, date_loc, asset_ix, asset_ix, 1.0 / ratio
                 )
-                try:
-                    col_adjustments[date_loc].append(volume_adj)
-                except KeyError:
-                    col_adjustments[date_loc] = [volume_adj]
+                col_adjustments[date_loc].append(volume_adj)
 
-    # mergers affect prices only
-    for sid, ratio, eff_date in mergers:
-        if eff_date < start_date:
-            continue
+    return [dict(col_adjustments) for col_adjustments in results]
 
-        date_loc = _lookup_dt(date_ixs, eff_date, _dates_seconds)
 
-        if not PyDict_Contains(asset_ixs, sid):
-            asset_ixs[sid] = assets.get_loc(sid)
-        asset_ix = asset_ixs[sid]
-
-        adj = Float64Multiply(0, date_loc, asset_ix, asset_ix, ratio)
-        for i, column in enumerate(columns):
-            col_adjustments = results[i]
-            if column != 'volume':
-                try:
-                    col_adjustments[date_loc].append(adj)
-                except KeyError:
-                    col_adjustments[date_loc] = [adj]
-
-    # dividends affect prices only
-    for sid, ratio, eff_date in dividends:
-        if eff_date < start_date:
-            continue
-
-        date_loc = _lookup_dt(date_ixs, eff_date, _dates_seconds)
+cdef ndarray _date_locs(ndarray[int64_t, ndim=1] dates_seconds,
+                       list adjustments):
+    """
+    Find the index into ``dates_seconds`` of the effective date of each
+    adjustment with a single vectorized search.
 
-        if not PyDict_Contains(asset_ixs, sid):
-            asset_ixs[sid] = assets.get_loc(sid)
-        asset_ix = asset_ixs[sid]
+    Parameters
+    ----------
+    dates_seconds : ndarray[int64]
+        The query dates, in seconds since epoch.
+    adjustments : list[tuple]
+        The (sid, ratio, effective_date) rows read from sqlite.
 
-        adj = Float64Multiply(0, date_loc, asset_ix, asset_ix, ratio)
-        for i, column in enumerate(columns):
-            col_adjustments = results[i]
-            if column != 'volume':
-                try:
-                    col_adjustments[date_loc].append(adj)
-                except KeyError:
-                    col_adjustments[date_loc] = [adj]
+    Returns
+    -------
+    date_locs : ndarray[intp]
+        The index of each effective date in ``dates_seconds``, or the index
+        at which it would be inserted if it is not a query date.
+    """
+    return dates_seconds.searchsorted(
+        array([row[2] for row in adjustments], dtype=int64),
+    )
 
-    return results
 
+cdef ndarray _asset_locs(Int64Index_t assets, list adjustments):
+    """
+    Find the index into ``assets`` of the sid of each adjustment with a single
+    vectorized lookup.
 
-cdef _lookup_dt(dict dt_cache,
-                int dt,
-                ndarray[int64_t, ndim=1] fallback):
+    Parameters
+    ----------
+    assets : pd.Int64Index
+        The assets for which adjustments were requested.
+    adjustments : list[tuple]
+        The (sid, ratio, effective_date) rows read from sqlite.
 
-    if not PyDict_Contains(dt_cache, dt):
-        dt_cache[dt] = fallback.searchsorted(dt, side='right')
-    return dt_cache[dt]
+    Returns
+    -------
+    asset_locs : ndarray[intp]
+        The index of each adjustment's sid in ``assets``.
+    """
+    return assets.get_indexer(
+        array([row[0] for row in adjustments], dtype=int64),
+    )
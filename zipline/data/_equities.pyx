@@ -17,8 +17,10 @@ cimport cython
 
 from numpy import (
     array,
+    empty,
     float64,
     intp,
+    multiply,
     uint32,
     zeros,
 )
@@ -36,6 +38,9 @@ ctypedef object Timestamp_t
 ctypedef object DatetimeIndex_t
 ctypedef object Int64Index_t
 
+# Columns stored as 1000 * the as-traded dollar value.
+cdef frozenset _PRICE_COLUMNS = frozenset(['open', 'high', 'low', 'close'])
+
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -186,9 +191,12 @@ cpdef _read_bcolz_data(ctable_t table,
             for out_idx, raw_idx in enumerate(range(first_row, last_row + 1)):
                 outbuf[out_idx + offset, asset] = raw_data[raw_idx]
 
-        if column_name in {'open', 'high', 'low', 'close'}:
+        if column_name in _PRICE_COLUMNS:
             where_nan = (outbuf == 0)
-            outbuf_as_float = outbuf.astype(float64) * .001
+            # Cast and scale in a single pass into one new buffer rather than
+            # allocating a float copy and then a second scaled array.
+            outbuf_as_float = empty(shape=shape, dtype=float64)
+            multiply(outbuf, .001, out=outbuf_as_float)
             outbuf_as_float[where_nan] = NAN
             results.append(outbuf_as_float)
         else:
@@ -35,6 +35,7 @@ from numpy import (
     iinfo,
     integer,
     issubdtype,
+    minimum,
     nan,
     uint32,
 )
@@ -678,11 +679,21 @@ class SQLiteAdjustmentWriter(object):
 
         effective_dates = full(len(amounts), -1, dtype=int64)
 
+        # Find all of the ex_dates in the calendar with a single search
+        # instead of a get_loc per dividend.
+        day_locs = calendar.values.searchsorted(ex_dates)
+        # searchsorted returns an insertion point for dates that are not in
+        # the calendar; fail on those the same way calendar.get_loc does.
+        not_in_calendar = (
+            calendar.values[minimum(day_locs, len(calendar) - 1)] != ex_dates
+        )
+        if not_in_calendar.any():
+            raise KeyError(ex_dates[not_in_calendar.argmax()])
+
         for i, amount in enumerate(amounts):
             sid = sids[i]
             ex_date = ex_dates[i]
-            day_loc = calendar.get_loc(ex_date)
-            prev_close_date = calendar[day_loc - 1]
+            prev_close_date = calendar[day_locs[i] - 1]
             try:
                 prev_close = daily_bar_reader.spot_price(
                     sid, prev_close_date, 'close')
@@ -854,9 +865,12 @@ class SQLiteAdjustmentWriter(object):
         self.write_frame('splits', splits)
         self.write_frame('mergers', mergers)
         self.write_dividend_data(dividends, stock_dividends)
+        # The reader queries the adjustment tables by sid within an
+        # effective_date range, so index on both to let sqlite seek directly
+        # to the rows in range for each sid.
         self.conn.execute(
             "CREATE INDEX splits_sids "
-            "ON splits(sid)"
+            "ON splits(sid, effective_date)"
         )
         self.conn.execute(
             "CREATE INDEX splits_effective_date "
@@ -864,7 +878,7 @@ class SQLiteAdjustmentWriter(object):
         )
         self.conn.execute(
             "CREATE INDEX mergers_sids "
-            "ON mergers(sid)"
+            "ON mergers(sid, effective_date)"
         )
         self.conn.execute(
             "CREATE INDEX mergers_effective_date "
@@ -872,7 +886,7 @@ class SQLiteAdjustmentWriter(object):
         )
         self.conn.execute(
             "CREATE INDEX dividends_sid "
-            "ON dividends(sid)"
+            "ON dividends(sid, effective_date)"
         )
         self.conn.execute(
             "CREATE INDEX dividends_effective_date "
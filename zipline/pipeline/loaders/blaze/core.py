@@ -126,8 +126,7 @@ from __future__ import division, absolute_import
 
 from abc import ABCMeta, abstractproperty
 from collections import namedtuple, defaultdict
-from copy import copy
-from functools import partial, reduce
+from functools import reduce
 from itertools import count
 import warnings
 from weakref import WeakKeyDictionary
@@ -148,11 +147,7 @@ from odo import odo
 import pandas as pd
 from six import with_metaclass, PY2, itervalues, iteritems
 from toolz import (
-    complement,
-    compose,
     concat,
-    flip,
-    groupby,
     identity,
     memoize,
 )
@@ -192,7 +187,19 @@ traversable_nodes = (
     bz.expr.Field,
     bz.expr.Label,
 )
-is_invalid_deltas_node = complement(flip(isinstance, valid_deltas_node_types))
+_valid_deltas_node_types_set = frozenset(valid_deltas_node_types)
+
+
+def is_invalid_deltas_node(node):
+    """Check if a node may not appear in an expression that has deltas."""
+    # Blaze expressions are almost always exactly one of the valid types, so
+    # try a set lookup before falling back to the subclass check.
+    return not (
+        type(node) in _valid_deltas_node_types_set or
+        isinstance(node, valid_deltas_node_types)
+    )
+
+
 get__name__ = op.attrgetter('__name__')
 
 
@@ -220,12 +227,12 @@ class ExprData(namedtuple('ExprData', 'expr deltas odo_kwargs')):
     def __repr__(self):
         # If the expressions have _resources() then the repr will
         # drive computation so we take the str here.
-        cls = type(self)
-        return super(ExprData, cls).__repr__(cls(
+        return '%s(expr=%r, deltas=%r, odo_kwargs=%r)' % (
+            type(self).__name__,
             str(self.expr),
             str(self.deltas),
             self.odo_kwargs,
-        ))
+        )
 
 
 class InvalidField(with_metaclass(ABCMeta)):
@@ -273,7 +280,44 @@ class NotPipelineCompatible(TypeError):
         return "'%s' is a non Pipeline API compatible type'" % self.args
 
 
-_new_names = ('BlazeDataSet_%d' % n for n in count())
+_new_name_ids = count()
+
+
+@memoize
+def _column_dtype(type_):
+    """Get the numpy dtype to use for a Pipeline API column of the given
+    datashape type.
+
+    Parameters
+    ----------
+    type_ : dshape
+        The type of the field.
+
+    Returns
+    -------
+    dtype : np.dtype or None
+        The dtype of the column, or None if ``type_`` is not a valid column
+        type.
+    invalid_field : type or None
+        The ``InvalidField`` subclass to use if ``type_`` is not a valid
+        column type, otherwise None.
+
+    Notes
+    -----
+    This function is memoized because datasets frequently share the same
+    few field types.
+    """
+    try:
+        # TODO: This should support datetime and bool columns.
+        if promote(type_, float64, promote_option=False) != float64:
+            raise NotPipelineCompatible()
+        if isinstance(type_, Option):
+            type_ = type_.ty
+    except NotPipelineCompatible:
+        return None, NonPipelineField
+    except TypeError:
+        return None, NonNumpyField
+    return type_.to_numpy_dtype(), None
 
 
 @memoize
@@ -311,27 +355,17 @@ def new_dataset(expr, deltas, missing_values):
         # Terms.
         if name in (SID_FIELD_NAME, TS_FIELD_NAME):
             continue
-        try:
-            # TODO: This should support datetime and bool columns.
-            if promote(type_, float64, promote_option=False) != float64:
-                raise NotPipelineCompatible()
-            if isinstance(type_, Option):
-                type_ = type_.ty
-        except NotPipelineCompatible:
-            col = NonPipelineField(name, type_)
-        except TypeError:
-            col = NonNumpyField(name, type_)
+        dtype, invalid_field = _column_dtype(type_)
+        if invalid_field is not None:
+            col = invalid_field(name, type_)
         else:
-            col = Column(
-                type_.to_numpy_dtype(),
-                missing_values.get(name, NotSpecified),
-            )
+            col = Column(dtype, missing_values.get(name, NotSpecified))
 
         columns[name] = col
 
     name = expr._name
     if name is None:
-        name = next(_new_names)
+        name = 'BlazeDataSet_' + str(next(_new_name_ids))
 
     # unicode is a name error in py3 but the branch is only hit
     # when we are in python 2.
@@ -532,15 +566,17 @@ def from_blaze(expr,
         from passing the parent is returned.
     """
     deltas = get_deltas(expr, deltas, no_deltas_rule)
-    if deltas is not None:
-        invalid_nodes = tuple(filter(is_invalid_deltas_node, expr._subterms()))
-        if invalid_nodes:
+    # A bare symbol is always a valid deltas node so there is no need to walk
+    # the expression tree in the common case of a plain table.
+    if deltas is not None and not isinstance(expr, bz.expr.Symbol):
+        if any(is_invalid_deltas_node(node) for node in expr._subterms()):
+            invalid_nodes = filter(is_invalid_deltas_node, expr._subterms())
             raise TypeError(
                 'expression with deltas may only contain (%s) nodes,'
                 " found: %s" % (
                     ', '.join(map(get__name__, valid_deltas_node_types)),
                     ', '.join(
-                        set(map(compose(get__name__, type), invalid_nodes)),
+                        set(type(node).__name__ for node in invalid_nodes),
                     ),
                 ),
             )
@@ -591,14 +627,15 @@ def from_blaze(expr,
     _check_datetime_field(AD_FIELD_NAME, measure)
     dataset_expr, deltas = _ensure_timestamp_field(dataset_expr, deltas)
 
-    if deltas is not None and (sorted(deltas.dshape.measure.fields) !=
-                               sorted(measure.fields)):
-        raise TypeError(
-            'baseline measure != deltas measure:\n%s != %s' % (
-                measure,
-                deltas.dshape.measure,
-            ),
-        )
+    if deltas is not None:
+        deltas_measure = deltas.dshape.measure
+        if frozenset(deltas_measure.fields) != frozenset(measure.fields):
+            raise TypeError(
+                'baseline measure != deltas measure:\n%s != %s' % (
+                    measure,
+                    deltas_measure,
+                ),
+            )
 
     # Ensure that we have a data resource to execute the query against.
     _check_resources('dataset_expr', dataset_expr, resources)
@@ -609,12 +646,19 @@ def from_blaze(expr,
         missing_values = {}
     ds = new_dataset(dataset_expr, deltas, frozenset(missing_values.items()))
 
+    # Bind the resources into the expressions. The baseline and deltas share
+    # one set of wrapped resources, and without resources the expressions
+    # are already bound.
+    if resources:
+        substitutions = _resource_substitutions(resources)
+        dataset_expr = dataset_expr._subs(substitutions)
+        if deltas is not None:
+            deltas = deltas._subs(substitutions)
+
     # Register our new dataset with the loader.
     (loader if loader is not None else global_loader)[ds] = ExprData(
-        bind_expression_to_resources(dataset_expr, resources),
-        bind_expression_to_resources(deltas, resources)
-        if deltas is not None else
-        None,
+        dataset_expr,
+        deltas,
         odo_kwargs=odo_kwargs,
     )
     if single_column is not None:
@@ -623,7 +667,6 @@ def from_blaze(expr,
     return ds
 
 
-getdataset = op.attrgetter('dataset')
 getname = op.attrgetter('name')
 
 
@@ -650,37 +693,38 @@ def overwrite_novel_deltas(baseline, deltas, dates):
         get_indexes(deltas[TS_FIELD_NAME].values, 'right') -
         get_indexes(deltas[AD_FIELD_NAME].values, 'left')
     ) <= 1
-    novel_deltas = deltas.loc[novel_idx]
-    non_novel_deltas = deltas.loc[~novel_idx]
-    return sort_values(pd.concat(
-        (baseline, novel_deltas),
-        ignore_index=True,
-    ), TS_FIELD_NAME), non_novel_deltas
-
-
-def overwrite_from_dates(asof, dense_dates, sparse_dates, asset_idx, value):
-    """Construct a `Float64Overwrite` with the correct
-    start and end date based on the asof date of the delta,
-    the dense_dates, and the dense_dates.
+    # Split positionally with ``take`` to skip the label based indexing path.
+    novel_deltas = deltas.take(np.flatnonzero(novel_idx))
+    non_novel_deltas = deltas.take(np.flatnonzero(~novel_idx))
+    # Use a stable sort so that novel deltas stay after the baseline values
+    # that share their timestamp; ``last_in_date_group`` takes the last value
+    # per date so this makes the delta win the tie.
+    return sort_values(
+        pd.concat((baseline, novel_deltas), ignore_index=True),
+        TS_FIELD_NAME,
+        kind='mergesort',
+    ), non_novel_deltas
+
+
+def overwrite_bounds_from_dates(asofs, dense_dates, sparse_dates):
+    """Compute the first and last rows that the `Float64Overwrite` for each
+    delta should apply to based on the asof date of the delta, the
+    dense_dates, and the sparse_dates.
 
     Parameters
     ----------
-    asof : datetime
-        The asof date of the delta.
+    asofs : np.ndarray[datetime64[ns]]
+        The asof dates of the deltas. These may not contain NaT.
     dense_dates : pd.DatetimeIndex
         The dates requested by the loader.
-    sparse_dates : pd.DatetimeIndex
+    sparse_dates : np.ndarray[datetime64[ns]]
         The dates that appeared in the dataset.
-    asset_idx : tuple of int
-        The index of the asset in the block. If this is a tuple, then this
-        is treated as the first and last index to use.
-    value : np.float64
-        The value to overwrite with.
 
     Returns
     -------
-    overwrite : Float64Overwrite
-        The overwrite that will apply the new value to the data.
+    first_rows, last_rows : np.ndarray[int]
+        The first and last row in ``dense_dates`` that each delta applies to.
+        Deltas where ``first_row > last_row`` do not apply to any row.
 
     Notes
     -----
@@ -694,34 +738,29 @@ def overwrite_from_dates(asof, dense_dates, sparse_dates, asset_idx, value):
 
     Then the overwrite will apply to indexes: 1, 2, 3, 4
     """
-    if asof is pd.NaT:
-        # Not an actual delta.
-        # This happens due to the groupby we do on the deltas.
-        return
-
-    first_row = dense_dates.searchsorted(asof)
-    next_idx = sparse_dates.searchsorted(asof.asm8, 'right')
-    if next_idx == len(sparse_dates):
-        # There is no next date in the sparse, this overwrite should apply
-        # through the end of the dense dates.
-        last_row = len(dense_dates) - 1
-    else:
-        # There is a next date in sparse dates. This means that the overwrite
-        # should only apply until the index of this date in the dense dates.
-        last_row = dense_dates.searchsorted(sparse_dates[next_idx]) - 1
+    # Search on the raw int64 nanoseconds of every array.
+    asofs = np.asarray(asofs, dtype='datetime64[ns]').view(np.int64)
+    dense_i8 = dense_dates.asi8
+    sparse_i8 = np.asarray(sparse_dates, dtype='datetime64[ns]').view(np.int64)
+    first_rows = dense_i8.searchsorted(asofs)
+    next_idx = sparse_i8.searchsorted(asofs, 'right')
 
-    if first_row > last_row:
-        return
+    # Deltas with no next sparse date apply through the end of the dense
+    # dates, the rest apply until the index of that date in the dense dates.
+    last_rows = np.full(len(asofs), len(dense_i8) - 1, dtype=np.intp)
+    has_next = next_idx != len(sparse_i8)
+    last_rows[has_next] = dense_i8.searchsorted(
+        sparse_i8[next_idx[has_next]],
+    ) - 1
 
-    first, last = asset_idx
-    yield Float64Overwrite(first_row, last_row, first, last, value)
+    return first_rows, last_rows
 
 
 def adjustments_from_deltas_no_sids(dense_dates,
                                     sparse_dates,
                                     column_idx,
                                     column_name,
-                                    asset_idx,
+                                    assets,
                                     deltas):
     """Collect all the adjustments that occur in a dataset that does not
     have a sid column.
@@ -736,8 +775,8 @@ def adjustments_from_deltas_no_sids(dense_dates,
         The index of the column in the dataset.
     column_name : str
         The name of the column to compute deltas for.
-    asset_idx : pd.Series[int -> int]
-        The mapping of sids to their index in the output.
+    assets : pd.Int64Index
+        The assets requested by the loader.
     deltas : pd.DataFrame
         The overwrites that should be applied to the dataset.
 
@@ -746,16 +785,32 @@ def adjustments_from_deltas_no_sids(dense_dates,
     adjustments : dict[idx -> Float64Overwrite]
         The adjustments dictionary to feed to the adjusted array.
     """
-    ad_series = deltas[AD_FIELD_NAME]
-    idx = 0, len(asset_idx) - 1
+    column = deltas[column_name]
+    asofs = deltas[AD_FIELD_NAME].values
+
+    # Entries with no asof date are not actual deltas.
+    # This happens due to the groupby we do on the deltas.
+    is_delta = pd.notnull(asofs)
+    date_locs = dense_dates.get_indexer(column.index)[is_delta]
+    values = column.values[is_delta]
+
+    first_rows, last_rows = overwrite_bounds_from_dates(
+        asofs[is_delta],
+        dense_dates,
+        sparse_dates,
+    )
+    last_col = len(assets) - 1
     return {
-        dense_dates.get_loc(kd): overwrite_from_dates(
-            ad_series.loc[kd],
-            dense_dates,
-            sparse_dates,
-            idx,
-            v,
-        ) for kd, v in deltas[column_name].iteritems()
+        date_loc: [
+            Float64Overwrite(first_row, last_row, 0, last_col, value),
+        ]
+        for date_loc, first_row, last_row, value in zip(
+            date_locs,
+            first_rows,
+            last_rows,
+            values,
+        )
+        if first_row <= last_row
     }
 
 
@@ -763,7 +818,7 @@ def adjustments_from_deltas_with_sids(dense_dates,
                                       sparse_dates,
                                       column_idx,
                                       column_name,
-                                      asset_idx,
+                                      assets,
                                       deltas):
     """Collect all the adjustments that occur in a dataset that has a sid
     column.
@@ -778,8 +833,8 @@ def adjustments_from_deltas_with_sids(dense_dates,
         The index of the column in the dataset.
     column_name : str
         The name of the column to compute deltas for.
-    asset_idx : pd.Series[int -> int]
-        The mapping of sids to their index in the output.
+    assets : pd.Int64Index
+        The assets requested by the loader.
     deltas : pd.DataFrame
         The overwrites that should be applied to the dataset.
 
@@ -788,23 +843,133 @@ def adjustments_from_deltas_with_sids(dense_dates,
     adjustments : dict[idx -> Float64Overwrite]
         The adjustments dictionary to feed to the adjusted array.
     """
-    ad_series = deltas[AD_FIELD_NAME]
+    column = deltas[column_name]
+    sids = column.columns
+    ndates = len(column.index)
+
+    # Flatten the (date, sid) grid so that we can compute all of the
+    # overwrites with a handful of vectorized calls.
+    asofs = deltas[AD_FIELD_NAME].reindex(columns=sids).values.ravel()
+    date_locs = np.repeat(dense_dates.searchsorted(column.index), len(sids))
+    asset_locs = np.tile(assets.get_indexer(sids), ndates)
+    values = column.values.ravel()
+
+    # Entries with no asof date are not actual deltas; they are holes
+    # created by the unstack of the deltas.
+    is_delta = pd.notnull(asofs)
+    asofs = asofs[is_delta]
+    date_locs = date_locs[is_delta]
+    asset_locs = asset_locs[is_delta]
+    values = values[is_delta]
+
+    first_rows, last_rows = overwrite_bounds_from_dates(
+        asofs,
+        dense_dates,
+        sparse_dates,
+    )
+    is_valid = first_rows <= last_rows
+
     adjustments = defaultdict(list)
-    for sid, per_sid in deltas[column_name].iteritems():
-        idx = asset_idx[sid]
-        for kd, v in per_sid.iteritems():
-            adjustments[dense_dates.searchsorted(kd)].extend(
-                overwrite_from_dates(
-                    ad_series.loc[kd, sid],
-                    dense_dates,
-                    sparse_dates,
-                    (idx, idx),
-                    v,
-                ),
-            )
+    for date_loc, first_row, last_row, asset_loc, value in zip(
+            date_locs[is_valid],
+            first_rows[is_valid],
+            last_rows[is_valid],
+            asset_locs[is_valid],
+            values[is_valid]):
+        adjustments[date_loc].append(
+            Float64Overwrite(first_row, last_row, asset_loc, asset_loc, value),
+        )
     return dict(adjustments)  # no subclasses of dict
 
 
+def _pred_for_col(e, ts_pred, column):
+    """Build the predicate selecting the rows of ``e`` that may supply a
+    known value for ``column`` as of the query's lower bound.
+    """
+    pred = ts_pred
+    colname = column.name
+    schema = e[colname].schema.measure
+    if isinstance(schema, Option):
+        pred &= e[colname].notnull()
+        schema = schema.ty
+    if schema in floating:
+        pred &= ~e[colname].isnan()
+    return pred
+
+
+def _lower_for_pred(e, pred, have_sids):
+    """Build the expression for the latest timestamp at which ``pred`` holds.
+    """
+    filtered = e[pred]
+    lower = filtered[TS_FIELD_NAME].max()
+    if have_sids:
+        # If we have sids, then we need to take the earliest of the
+        # greatest date that has a non-null value by sid.
+        lower = bz.by(
+            filtered[SID_FIELD_NAME],
+            timestamp=lower,
+        ).timestamp.min()
+    return lower
+
+
+def _where(e,
+           columns,
+           lower_dt,
+           upper_dt,
+           have_sids,
+           added_query_fields,
+           odo_kwargs):
+    """Create the query to run against the resources.
+
+    Parameters
+    ----------
+    e : Expr
+        The baseline or deltas expression.
+    columns : list[BoundColumn]
+        The columns being loaded.
+    lower_dt, upper_dt : pd.Timestamp
+        The query bounds for the dates being loaded.
+    have_sids : bool
+        Does ``e`` have a sid field?
+    added_query_fields : list[str]
+        The metadata fields to select along with ``columns``.
+    odo_kwargs : dict
+        The keyword arguments to forward to the odo calls.
+
+    Returns
+    -------
+    q : Expr
+        The query to run.
+    """
+    # The timestamp bound is the same for every column, build it once.
+    ts_pred = e[TS_FIELD_NAME] <= lower_dt
+
+    # Columns that cannot hold missing values all share ``ts_pred``; only
+    # compute the lower bound once for them. We dedupe by identity because
+    # ``==`` on blaze expressions builds a new expression.
+    preds = {
+        id(pred): pred
+        for pred in (_pred_for_col(e, ts_pred, c) for c in columns)
+    }
+    lower = odo(
+        reduce(
+            bz.least,
+            (
+                _lower_for_pred(e, pred, have_sids)
+                for pred in itervalues(preds)
+            ),
+        ),
+        pd.Timestamp,
+        **odo_kwargs
+    )
+    if lower is pd.NaT:
+        lower = lower_dt
+    return e[
+        (e[TS_FIELD_NAME] >= lower) &
+        (e[TS_FIELD_NAME] <= upper_dt)
+    ][added_query_fields + list(map(getname, columns))]
+
+
 class BlazeLoader(dict):
     """A PipelineLoader for datasets constructed with ``from_blaze``.
 
@@ -843,23 +1008,23 @@ class BlazeLoader(dict):
         raise KeyError(column)
 
     def load_adjusted_array(self, columns, dates, assets, mask):
+        columns_by_dataset = defaultdict(list)
+        for column in columns:
+            columns_by_dataset[column.dataset].append(column)
+
         return dict(
-            concat(map(
-                partial(self._load_dataset, dates, assets, mask),
-                itervalues(groupby(getdataset, columns))
-            ))
+            concat(
+                self._load_dataset(dates, assets, mask, dataset, ds_columns)
+                for dataset, ds_columns in iteritems(columns_by_dataset)
+            )
         )
 
-    def _load_dataset(self, dates, assets, mask, columns):
-        try:
-            (dataset,) = set(map(getdataset, columns))
-        except ValueError:
-            raise AssertionError('all columns must come from the same dataset')
-
+    def _load_dataset(self, dates, assets, mask, dataset, columns):
         expr, deltas, odo_kwargs = self[dataset]
         have_sids = SID_FIELD_NAME in expr.fields
-        asset_idx = pd.Series(index=assets, data=np.arange(len(assets)))
-        assets = list(map(int, assets))  # coerce from numpy.int64
+        asset_index = pd.Index(assets)
+        # coerce from numpy.int64
+        assets = asset_index.values.astype(np.int64).tolist()
         added_query_fields = [AD_FIELD_NAME, TS_FIELD_NAME] + (
             [SID_FIELD_NAME] if have_sids else []
         )
@@ -873,55 +1038,6 @@ class BlazeLoader(dict):
             data_query_tz,
         )
 
-        def where(e):
-            """Create the query to run against the resources.
-
-            Parameters
-            ----------
-            e : Expr
-                The baseline or deltas expression.
-
-            Returns
-            -------
-            q : Expr
-                The query to run.
-            """
-            def lower_for_col(column):
-                pred = e[TS_FIELD_NAME] <= lower_dt
-                colname = column.name
-                schema = e[colname].schema.measure
-                if isinstance(schema, Option):
-                    pred &= e[colname].notnull()
-                    schema = schema.ty
-                if schema in floating:
-                    pred &= ~e[colname].isnan()
-
-                filtered = e[pred]
-                lower = filtered[TS_FIELD_NAME].max()
-                if have_sids:
-                    # If we have sids, then we need to take the earliest of the
-                    # greatest date that has a non-null value by sid.
-                    lower = bz.by(
-                        filtered[SID_FIELD_NAME],
-                        timestamp=lower,
-                    ).timestamp.min()
-                return lower
-
-            lower = odo(
-                reduce(
-                    bz.least,
-                    map(lower_for_col, columns),
-                ),
-                pd.Timestamp,
-                **odo_kwargs
-            )
-            if lower is pd.NaT:
-                lower = lower_dt
-            return e[
-                (e[TS_FIELD_NAME] >= lower) &
-                (e[TS_FIELD_NAME] <= upper_dt)
-            ][added_query_fields + list(map(getname, columns))]
-
         def collect_expr(e):
             """Execute and merge all of the per-column subqueries.
 
@@ -940,8 +1056,24 @@ class BlazeLoader(dict):
             This can return more data than needed. The in memory reindex will
             handle this.
             """
-            df = odo(where(e), pd.DataFrame, **odo_kwargs)
-            df.sort(TS_FIELD_NAME, inplace=True)  # sort for the groupby later
+            df = odo(
+                _where(
+                    e,
+                    columns,
+                    lower_dt,
+                    upper_dt,
+                    have_sids,
+                    added_query_fields,
+                    odo_kwargs,
+                ),
+                pd.DataFrame,
+                **odo_kwargs
+            )
+            # sort for the groupby later; backends often return rows in
+            # timestamp order already so check before paying for the sort
+            ts = df[TS_FIELD_NAME].values
+            if (ts[1:] < ts[:-1]).any():
+                df = df.take(ts.argsort(kind='mergesort'))
             return df
 
         materialized_expr = collect_expr(expr)
@@ -956,16 +1088,16 @@ class BlazeLoader(dict):
         # It's not guaranteed that assets returned by the engine will contain
         # all sids from the deltas table; filter out such mismatches here.
         if not materialized_deltas.empty and have_sids:
-            materialized_deltas = materialized_deltas[
-                materialized_deltas[SID_FIELD_NAME].isin(assets)
-            ]
+            materialized_deltas = materialized_deltas.take(np.flatnonzero(
+                asset_index.get_indexer(
+                    materialized_deltas[SID_FIELD_NAME].values,
+                ) != -1,
+            ))
 
         if data_query_time is not None:
             for m in (materialized_expr, materialized_deltas):
-                m.loc[:, TS_FIELD_NAME] = m.loc[
-                    :, TS_FIELD_NAME
-                ].astype('datetime64[ns]')
-
+                # This writes the timestamps back as datetime64[ns] so there
+                # is no need to cast the column first.
                 normalize_timestamp_to_query_time(
                     m,
                     data_query_time,
@@ -982,31 +1114,59 @@ class BlazeLoader(dict):
             materialized_deltas,
             dates,
         )
-        sparse_output.drop(AD_FIELD_NAME, axis=1, inplace=True)
 
-        def last_in_date_group(df, reindex, have_sids=have_sids):
-            idx = dates[dates.searchsorted(
-                df[TS_FIELD_NAME].values.astype('datetime64[D]')
+        # The dates are midnights, so the first date on or after the day of
+        # a timestamp is the first date whose following midnight is after
+        # the timestamp. Shifting the dates lets us search with the raw
+        # timestamps instead of truncating every one of them to a day.
+        day_ends = dates.asi8 + pd.Timedelta(days=1).value
+
+        def last_in_date_group(df,
+                               reindex,
+                               have_sids=have_sids,
+                               skip_fields=(TS_FIELD_NAME, SID_FIELD_NAME)):
+            idx = dates[day_ends.searchsorted(
+                np.asarray(
+                    df[TS_FIELD_NAME].values,
+                    dtype='datetime64[ns]',
+                ).view(np.int64),
+                'right',
             )]
             if have_sids:
                 idx = [idx, SID_FIELD_NAME]
 
-            last_in_group = df.drop(TS_FIELD_NAME, axis=1).groupby(
-                idx,
-                sort=False,
-            ).last()
+            # ``last`` takes the last non-null value of each column in the
+            # group, which is not always from the same row, so this cannot be
+            # replaced with a positional take of the last row per key.
+            # Select the value columns on the groupby rather than copying the
+            # whole input without the timestamps first.
+            value_fields = [
+                field for field in df.columns
+                if field not in skip_fields
+            ]
+            last_in_group = df.groupby(idx, sort=False)[value_fields].last()
 
             if have_sids:
                 last_in_group = last_in_group.unstack()
 
             if reindex:
                 if have_sids:
-                    cols = last_in_group.columns
+                    fields = last_in_group.columns.levels[0]
+                    nfields = len(fields)
+                    nassets = len(asset_index)
+                    # Build the (field, asset) product from its labels; the
+                    # assets are already unique so there is nothing for
+                    # ``from_product`` to factorize or verify.
                     last_in_group = last_in_group.reindex(
                         index=dates,
-                        columns=pd.MultiIndex.from_product(
-                            (cols.levels[0], assets),
-                            names=cols.names,
+                        columns=pd.MultiIndex(
+                            levels=[fields, asset_index],
+                            labels=[
+                                np.repeat(np.arange(nfields), nassets),
+                                np.tile(np.arange(nassets), nfields),
+                            ],
+                            names=last_in_group.columns.names,
+                            verify_integrity=False,
                         ),
                     )
                 else:
@@ -1014,8 +1174,22 @@ class BlazeLoader(dict):
 
             return last_in_group
 
-        sparse_deltas = last_in_date_group(non_novel_deltas, reindex=False)
-        dense_output = last_in_date_group(sparse_output, reindex=True)
+        if non_novel_deltas.empty:
+            # Most loads have no deltas that overwrite past values, there is
+            # nothing to group or to turn into adjustments.
+            sparse_deltas = None
+        else:
+            sparse_deltas = last_in_date_group(
+                non_novel_deltas,
+                reindex=False,
+            )
+        # The dense output only needs the values, leave the asof dates out
+        # of the grouping rather than dropping them from the sparse output.
+        dense_output = last_in_date_group(
+            sparse_output,
+            reindex=True,
+            skip_fields=(TS_FIELD_NAME, SID_FIELD_NAME, AD_FIELD_NAME),
+        )
         dense_output.ffill(inplace=True)
 
         if have_sids:
@@ -1023,24 +1197,29 @@ class BlazeLoader(dict):
             column_view = identity
         else:
             # We use the column view to make an array per asset.
-            column_view = compose(
-                # We need to copy this because we need a concrete ndarray.
+            def column_view(arr, _nassets=len(assets)):
                 # The `repeat_last_axis` call will give us a fancy strided
                 # array which uses a buffer to represent `len(assets)` columns.
+                # We do not need to copy it here: AdjustedArray always casts
+                # its input into a new concrete ndarray before writing to it.
                 # The engine puts nans at the indicies for which we do not have
                 # sid information so that the nan-aware reductions still work.
                 # A future change to the engine would be to add first class
                 # support for macro econimic datasets.
-                copy,
-                partial(repeat_last_axis, count=len(assets)),
-            )
+                return repeat_last_axis(arr, count=_nassets)
+
             adjustments_from_deltas = adjustments_from_deltas_no_sids
 
         for column_idx, column in enumerate(columns):
             column_name = column.name
             yield column, AdjustedArray(
                 column_view(
-                    dense_output[column_name].values.astype(column.dtype),
+                    # Only cast if the dtype is different, AdjustedArray
+                    # makes its own copy of the data.
+                    dense_output[column_name].values.astype(
+                        column.dtype,
+                        copy=False,
+                    ),
                 ),
                 mask,
                 adjustments_from_deltas(
@@ -1048,9 +1227,11 @@ class BlazeLoader(dict):
                     sparse_output[TS_FIELD_NAME].values,
                     column_idx,
                     column_name,
-                    asset_idx,
+                    asset_index,
                     sparse_deltas,
-                ),
+                )
+                if sparse_deltas is not None else
+                {},
                 column.missing_value,
             )
 
@@ -1073,16 +1254,33 @@ def bind_expression_to_resources(expr, resources):
     bound_expr : bz.Expr
         ``expr`` with bound resources.
     """
-    # bind the resources into the expression
-    if resources is None:
-        resources = {}
+    if not resources:
+        # nothing to substitute, skip walking the expression tree
+        return expr
 
     # _subs stands for substitute.  It's not actually private, blaze just
     # prefixes symbol-manipulation methods with underscores to prevent
     # collisions with data column names.
-    return expr._subs({
-        k: bz.Data(v, dshape=k.dshape) for k, v in iteritems(resources)
-    })
+    return expr._subs(_resource_substitutions(resources))
+
+
+def _resource_substitutions(resources):
+    """
+    Wrap each resource in a ``bz.Data`` so that it can be substituted for its
+    symbol in an expression.
+
+    Parameters
+    ----------
+    resources : dict[bz.Symbol -> any]
+        Mapping from the loadable terms of an expression to actual data
+        resources.
+
+    Returns
+    -------
+    substitutions : dict[bz.Symbol -> bz.Data]
+        The argument to pass to ``expr._subs``.
+    """
+    return {k: bz.Data(v, dshape=k.dshape) for k, v in iteritems(resources)}
 
 
 def ffill_query_in_range(expr,
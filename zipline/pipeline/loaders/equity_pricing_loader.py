@@ -85,7 +85,9 @@ class USEquityPricingLoader(PipelineLoader):
         out = {}
         for c, c_raw, c_adjs in zip(columns, raw_arrays, adjustments):
             out[c] = AdjustedArray(
-                c_raw.astype(c.dtype),
+                # Price columns are already read as float64, so only volume
+                # actually needs a new array here.
+                c_raw.astype(c.dtype, copy=False),
                 mask,
                 c_adjs,
                 c.missing_value,
@@ -213,6 +213,20 @@ def normalize_data_query_bounds(lower, upper, time, tz):
     return lower, upper
 
 
+_NANOS_IN_DAY = pd.Timedelta(days=1).value
+
+
+def _time_to_nanos(time):
+    """Convert a ``datetime.time`` into nanoseconds since midnight.
+    """
+    return pd.Timedelta(
+        hours=time.hour,
+        minutes=time.minute,
+        seconds=time.second,
+        microseconds=time.microsecond,
+    ).value
+
+
 def normalize_timestamp_to_query_time(df,
                                       time,
                                       tz,
@@ -248,15 +262,26 @@ def normalize_timestamp_to_query_time(df,
         # don't mutate the dataframe in place
         df = df.copy()
 
+    if df.empty:
+        # nothing to normalize, only match the dtype written below
+        df[ts_field] = df[ts_field].values.astype('datetime64[ns]')
+        return df
+
     dtidx = pd.DatetimeIndex(df.loc[:, ts_field], tz='utc')
     dtidx_local_time = dtidx.tz_convert(tz)
-    to_roll_forward = dtidx_local_time.time >= time
+    # compare the local time of day as nanoseconds instead of boxing every
+    # row into a datetime.time
+    to_roll_forward = (
+        dtidx_local_time.tz_localize(None).asi8 % _NANOS_IN_DAY >=
+        _time_to_nanos(time)
+    )
+    normalized = dtidx.normalize().values
     # for all of the times that are greater than our query time add 1
     # day and truncate to the date
-    df.loc[to_roll_forward, ts_field] = (
+    normalized[to_roll_forward] = (
         dtidx_local_time[to_roll_forward] + datetime.timedelta(days=1)
-    ).normalize().tz_localize(None).tz_localize('utc')  # cast back to utc
-    df.loc[~to_roll_forward, ts_field] = dtidx[~to_roll_forward].normalize()
+    ).normalize().tz_localize(None).tz_localize('utc').values  # cast to utc
+    df[ts_field] = normalized
     return df
 
 